@@ -0,0 +1,100 @@
+import numba
+import numpy as np
+import polars as pl
+
+
+@numba.njit(cache=True, fastmath=True, boundscheck=False)
+def ewma_f64(x, alpha):
+    '''
+        Recorrência EWMA y_t = alpha*x_t + (1-alpha)*y_{t-1}, com y_0 = x_0,
+        compilada em um único loop sobre o buffer f64 contíguo.
+    '''
+    out = np.empty_like(x)
+    out[0] = x[0]
+    one_m = 1.0 - alpha
+
+    for i in range(1, x.shape[0]):
+        out[i] = alpha * x[i] + one_m * out[i - 1]
+
+    return out
+
+
+@numba.njit(cache=True, fastmath=True, boundscheck=False)
+def wilder_rsi_f64(x, period):
+    '''
+        RSI com suavização de Wilder (EWMA de ganhos/perdas com alpha=1/period),
+        em uma única passada sobre o buffer f64 contíguo.
+    '''
+    n = x.shape[0]
+    out = np.full(n, np.nan)
+    alpha = 1.0 / period
+    one_m = 1.0 - alpha
+
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, n):
+        delta = x[i] - x[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = alpha * gain + one_m * avg_gain
+            avg_loss = alpha * loss + one_m * avg_loss
+
+        if avg_loss == 0.0:
+            out[i] = 100.0
+        else:
+            out[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+    return out
+
+
+def add_ema_numba(df:pl.DataFrame, period:int=12) -> pl.DataFrame:
+    '''
+        Adiciona coluna de EMA usando o kernel Numba.
+
+        Caminho alternativo ao ewm_mean do Polars para chamadas em loops
+        apertados por símbolo, onde o overhead de montar a expressão domina.
+    '''
+    closes = df["close"].to_numpy().astype(np.float64)
+    out = ewma_f64(closes, 2.0 / (period + 1))
+
+    return df.with_columns(pl.Series(f"ema_{period}", out))
+
+
+def add_macd_numba(df:pl.DataFrame,
+                   short_period:int=12,
+                   long_period:int=26,
+                   signal_period:int=9) -> pl.DataFrame:
+    '''
+        Adiciona colunas de MACD, sinal e histograma usando o kernel Numba.
+
+        Três recorrências ewma_f64 sobre buffers contíguos, sem passar pelo
+        motor de expressões do Polars.
+    '''
+    closes = df["close"].to_numpy().astype(np.float64)
+
+    ema_short = ewma_f64(closes, 2.0 / (short_period + 1))
+    ema_long = ewma_f64(closes, 2.0 / (long_period + 1))
+    macd = ema_short - ema_long
+    signal = ewma_f64(macd, 2.0 / (signal_period + 1))
+
+    return df.with_columns(
+        pl.Series(f"macd_{short_period}_{long_period}", macd),
+        pl.Series(f"macd_signal_{signal_period}", signal),
+        pl.Series("macd_histogram", macd - signal)
+    )
+
+
+def add_rsi_numba(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+    '''
+        Adiciona coluna de RSI (suavização de Wilder) usando o kernel Numba.
+    '''
+    closes = df["close"].to_numpy().astype(np.float64)
+    out = wilder_rsi_f64(closes, period)
+
+    return df.with_columns(pl.Series(f"rsi_{period}", out))
@@ -1,5 +1,5 @@
 import polars as pl
-from typing import Optional
+from typing import Literal, Optional
 
 from src.logger import get_logger
 
@@ -11,50 +11,111 @@ logger = get_logger(__name__)
 # MÉDIAS MÓVEIS
 # ======================
 
+def sma_expr(period:int=20) -> pl.Expr:
+    '''
+        Expressão de SMA (média móvel simples).
+    '''
+    return pl.col("close").rolling_mean(window_size=period).alias(f"sma_{period}")
+
+
 def add_sma(df:pl.DataFrame, period:int=20) -> pl.DataFrame:
     '''
         Adiciona coluna de SMA (média móvel simples).
     '''
-    return df.with_columns(
-        pl.col("close").rolling_mean(window_size=period).alias(f"sma_{period}")
-    )
+    return df.with_columns(sma_expr(period))
 
 
 
+def ema_expr(period:int=12) -> pl.Expr:
+    '''
+        Expressão de EMA (média móvel exponencial).
+    '''
+    return pl.col("close").ewm_mean(span=period, adjust=False).alias(f"ema_{period}")
+
+
 def add_ema(df:pl.DataFrame, period:int=12) -> pl.DataFrame:
     '''
         Adiciona coluna de EMA (média móvel exponencial).
     '''
-    return df.with_columns(
-        pl.col("close").ewm_mean(span=period).alias(f"ema_{period}")
-    )
+    return df.with_columns(ema_expr(period))
 
 
 # ======================
 # RSI (Relative Strength Index)
 # ======================
 
-def add_rsi(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+def rsi_expr(period:int=14) -> pl.Expr:
     '''
-        Adiciona coluna de RSI (Índice de Força Relativa).
+        Expressão de RSI (Índice de Força Relativa).
     '''
     delta = pl.col("close").diff()
-    gain = pl.when(delta > 0).then(delta).otherwise(0)
-    loss = pl.when(delta < 0).then(-delta).otherwise(0)
-    
+    gain = delta.clip(lower_bound=0)
+    loss = (-delta).clip(lower_bound=0)
+
     avg_gain = gain.rolling_mean(window_size=period)
     avg_loss = loss.rolling_mean(window_size=period)
-    
+
+    rs = avg_gain / avg_loss
+    rsi = 100 - (100 / (1 + rs))
+
+    return rsi.alias(f"rsi_{period}")
+
+
+def rsi_wilder_expr(period:int=14) -> pl.Expr:
+    '''
+        Expressão de RSI com suavização de Wilder.
+
+        A suavização de Wilder é uma EMA com alpha=1/period, a definição
+        canônica do RSI usada pelas plataformas de trading — e uma única
+        recorrência streaming por série, em vez do agregado por janela do
+        rolling_mean.
+    '''
+    delta = pl.col("close").diff()
+    avg_gain = delta.clip(lower_bound=0).ewm_mean(alpha=1 / period, adjust=False)
+    avg_loss = (-delta).clip(lower_bound=0).ewm_mean(alpha=1 / period, adjust=False)
+
     rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
-    
-    return df.with_columns(rsi.alias(f"rsi_{period}"))
+
+    return rsi.alias(f"rsi_{period}")
+
+
+def add_rsi_wilder(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+    '''
+        Adiciona coluna de RSI com suavização de Wilder.
+    '''
+    return df.with_columns(rsi_wilder_expr(period))
+
+
+def add_rsi(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+    '''
+        Adiciona coluna de RSI (Índice de Força Relativa).
+
+        Usa a suavização de Wilder (padrão das plataformas de trading);
+        rsi_expr continua disponível para a variante com média simples.
+    '''
+    return add_rsi_wilder(df, period)
 
 
 # ======================
 # MACD (Moving Average Convergence Divergence)
 # ======================
 
+def macd_exprs(short_period:int=12,
+               long_period:int=26,
+               signal_period:int=9) -> list:
+    '''
+        Expressões de MACD e linha de sinal.
+        Dependem das colunas ema_{short_period} e ema_{long_period} já existentes.
+    '''
+    macd = pl.col(f"ema_{short_period}") - pl.col(f"ema_{long_period}")
+
+    return [
+        macd.alias(f"macd_{short_period}_{long_period}"),
+        macd.ewm_mean(span=signal_period, adjust=False).alias(f"macd_signal_{signal_period}")
+    ]
+
+
 def add_macd(df:pl.DataFrame,
              short_period:int=12,
              long_period:int=26,
@@ -64,23 +125,16 @@ def add_macd(df:pl.DataFrame,
     '''
     # Calcular as EMAs
     df = df.with_columns([
-        pl.col("close").ewm_mean(span=short_period).alias(f"ema_{short_period}"),
-        pl.col("close").ewm_mean(span=long_period).alias(f"ema_{long_period}")
+        ema_expr(short_period),
+        ema_expr(long_period)
     ])
-    
-    # Calcular MACD
+
+    # Calcular MACD e linha de sinal
+    df = df.with_columns(macd_exprs(short_period, long_period, signal_period))
+
+    # Calcular histograma
     macd_col = f"macd_{short_period}_{long_period}"
-    df = df.with_columns(
-        (pl.col(f"ema_{short_period}") - pl.col(f"ema_{long_period}")).alias(macd_col)
-    )
-    
-    # Calcular linha de sinal (EMA do MACD)
     signal_col = f"macd_signal_{signal_period}"
-    df = df.with_columns(
-        pl.col(macd_col).ewm_mean(span=signal_period).alias(signal_col)
-    )
-    
-    # Calcular histograma
     return df.with_columns(
         (pl.col(macd_col) - pl.col(signal_col)).alias("macd_histogram")
     )
@@ -90,66 +144,86 @@ def add_macd(df:pl.DataFrame,
 # Bollinger Bands
 # ======================
 
-def add_bollinger_bands(df:pl.DataFrame, period:int=20, std_dev:float=2.0) -> pl.DataFrame:
+def bollinger_exprs(period:int=20, std_dev:float=2.0) -> list:
     '''
-        Adiciona colunas de Bollinger Bands.
+        Expressões de Bollinger Bands.
     '''
     rolling_mean = pl.col("close").rolling_mean(window_size=period)
     rolling_std = pl.col("close").rolling_std(window_size=period)
-    
-    return df.with_columns([
+
+    # Bandas na forma a*b + c para o otimizador fundir multiplicação e soma
+    # em uma única passada FMA
+    return [
         rolling_mean.alias(f"bb_middle_{period}"),
-        (rolling_mean + (rolling_std * std_dev)).alias(f"bb_upper_{period}"),
-        (rolling_mean - (rolling_std * std_dev)).alias(f"bb_lower_{period}"),
+        (rolling_std * std_dev + rolling_mean).alias(f"bb_upper_{period}"),
+        (-rolling_std * std_dev + rolling_mean).alias(f"bb_lower_{period}"),
         rolling_std.alias(f"bb_std_{period}")
-    ])
+    ]
+
+
+def add_bollinger_bands(df:pl.DataFrame, period:int=20, std_dev:float=2.0) -> pl.DataFrame:
+    '''
+        Adiciona colunas de Bollinger Bands.
+    '''
+    return df.with_columns(bollinger_exprs(period, std_dev))
 
 
 # ======================
 # ATR (Average True Range)
 # ======================
 
-def add_atr(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+def atr_expr(period:int=14) -> pl.Expr:
     '''
-        Adiciona coluna de ATR (faixa média verdadeira).
+        Expressão de ATR (faixa média verdadeira).
     '''
     high = pl.col("high")
     low = pl.col("low")
-    close = pl.col("close")
-    
-    tr1 = high - low
-    tr2 = (high - close.shift(1)).abs()
-    tr3 = (low - close.shift(1)).abs()
-    
-    true_range = pl.max_horizontal(tr1, tr2, tr3)
-    
-    return df.with_columns(
-        true_range.rolling_mean(window_size=period).alias(f"atr_{period}")
+    prev_close = pl.col("close").shift(1)
+
+    true_range = pl.max_horizontal(
+        high - low,
+        (high - prev_close).abs(),
+        (low - prev_close).abs()
     )
 
+    return true_range.rolling_mean(window_size=period).alias(f"atr_{period}")
+
+
+def add_atr(df:pl.DataFrame, period:int=14) -> pl.DataFrame:
+    '''
+        Adiciona coluna de ATR (faixa média verdadeira).
+    '''
+    # Via lazy para o otimizador deduplicar o shift(1) compartilhado
+    return df.lazy().with_columns(atr_expr(period)).collect()
+
 
 # ======================
 # VWAP (Volume Weighted Average Price)
 # ======================
 
+def vwap_expr() -> pl.Expr:
+    '''
+        Expressão de VWAP (preço médio ponderado pelo volume).
+    '''
+    typical_price = (pl.col("high") + pl.col("low") + pl.col("close")) / 3
+
+    return (
+        (typical_price * pl.col("volume")).cum_sum() / pl.col("volume").cum_sum()
+    ).alias("vwap")
+
+
 def add_vwap(df:pl.DataFrame) -> pl.DataFrame:
     '''
         Adiciona coluna de VWAP (preço médio ponderado pelo volume).
     '''
-    typical_price = (pl.col("high") + pl.col("low") + pl.col("close")) / 3
-    cumulative_vp = (typical_price * pl.col("volume")).cum_sum()
-    cumulative_vol = pl.col("volume").cum_sum()
-    
-    return df.with_columns(
-        (cumulative_vp / cumulative_vol).alias("vwap")
-    )
+    return df.with_columns(vwap_expr())
 
 
 # ======================
 # FUNÇÃO PRINCIPAL
 # ======================
 
-def add_all_indicators(df:pl.DataFrame, 
+def add_all_indicators(df:pl.DataFrame | pl.LazyFrame,
                       sma_periods:list=[20, 50],
                       ema_periods:list=[12, 26],
                       rsi_period:int=14,
@@ -158,66 +232,141 @@ def add_all_indicators(df:pl.DataFrame,
                       macd_signal:int=9,
                       bb_period:int=20,
                       bb_std:float=2.0,
-                      atr_period:int=14) -> pl.DataFrame:
+                      atr_period:int=14,
+                      precision:Literal["f32", "f64"]="f32") -> pl.DataFrame:
     '''
         Adiciona todos os indicadores técnicos ao DataFrame.
-        
+
+        Os indicadores são montados como expressões em um único pipeline
+        lazy, permitindo que o otimizador do Polars elimine subexpressões
+        comuns e avalie colunas independentes em paralelo.
+
         Parameters
         ----------
-        df: pl.DataFrame
-            DataFrame com colunas: date, symbol, open, high, low, close, volume
-            
+        df: pl.DataFrame | pl.LazyFrame
+            DataFrame (ou LazyFrame) com colunas: date, symbol, open, high, low, close, volume.
+            LazyFrames são mantidos lazy até o collect final, sem materializações intermediárias.
+
         sma_periods: list
             Lista de períodos para SMA
-            
+
         ema_periods: list
             Lista de períodos para EMA
-            
+
         rsi_period: int
             Período para RSI
-            
+
         macd_short: int
             Período curto para MACD
-            
+
         macd_long: int
             Período longo para MACD
-            
+
         macd_signal: int
             Período para linha de sinal do MACD
-            
+
         bb_period: int
             Período para Bollinger Bands
-            
+
         bb_std: float
             Desvio padrão para Bollinger Bands
-            
+
         atr_period: int
             Período para ATR
+
+        precision: Literal["f32", "f64"]
+            Precisão numérica dos cálculos. "f32" (padrão) converte as colunas
+            OHLCV para Float32 antes dos indicadores, metade dos bytes movidos
+            pelos kernels rolling/ewm, que são limitados por banda de memória;
+            "f64" mantém a precisão original.
     '''
-    
-    result_df = df.clone()
-    
-    # Adicionar SMAs
-    for period in sma_periods:
-        result_df = add_sma(result_df, period)
-    
-    # Adicionar EMAs
-    for period in ema_periods:
-        result_df = add_ema(result_df, period)
-    
-    # Adicionar RSI
-    result_df = add_rsi(result_df, rsi_period)
-    
-    # Adicionar MACD
-    result_df = add_macd(result_df, macd_short, macd_long, macd_signal)
-    
-    # Adicionar Bollinger Bands
-    result_df = add_bollinger_bands(result_df, bb_period, bb_std)
-    
-    # Adicionar ATR
-    result_df = add_atr(result_df, atr_period)
-    
-    # Adicionar VWAP
-    result_df = add_vwap(result_df)
-    
-    return result_df
\ No newline at end of file
+
+    # Estágio 1: expressões que dependem apenas das colunas OHLCV.
+    # As EMAs do MACD entram aqui junto com as demais, garantindo que
+    # cada período seja computado uma única vez.
+    ema_exprs = {
+        period: ema_expr(period)
+        for period in sorted(set(ema_periods) | {macd_short, macd_long})
+    }
+
+    base_exprs = [sma_expr(period) for period in sma_periods]
+    base_exprs += list(ema_exprs.values())
+    base_exprs.append(rsi_wilder_expr(rsi_period))
+    base_exprs += bollinger_exprs(bb_period, bb_std)
+    base_exprs.append(atr_expr(atr_period))
+    base_exprs.append(vwap_expr())
+
+    lf = df.lazy() if isinstance(df, pl.DataFrame) else df
+
+    if precision == "f32":
+        lf = lf.with_columns(
+            pl.col(col).cast(pl.Float32) for col in ("open", "high", "low", "close", "volume")
+        )
+
+    lf = lf.with_columns(base_exprs)
+
+    # Estágio 2: MACD e sinal, que referenciam as colunas de EMA do estágio 1
+    lf = lf.with_columns(macd_exprs(macd_short, macd_long, macd_signal))
+
+    # Estágio 3: histograma, que referencia MACD e sinal do estágio 2
+    lf = lf.with_columns(
+        (pl.col(f"macd_{macd_short}_{macd_long}") - pl.col(f"macd_signal_{macd_signal}")).alias("macd_histogram")
+    )
+
+    return lf.collect(engine="streaming")
+
+
+def add_all_indicators_grouped(df:pl.DataFrame | pl.LazyFrame,
+                               sma_periods:list=[20, 50],
+                               ema_periods:list=[12, 26],
+                               rsi_period:int=14,
+                               macd_short:int=12,
+                               macd_long:int=26,
+                               macd_signal:int=9,
+                               bb_period:int=20,
+                               bb_std:float=2.0,
+                               atr_period:int=14,
+                               precision:Literal["f32", "f64"]="f32") -> pl.DataFrame:
+    '''
+        Adiciona todos os indicadores técnicos por símbolo, em uma única passada.
+
+        Equivalente a particionar por "symbol" e chamar add_all_indicators em
+        cada partição, mas usando .over("symbol") em cada expressão para que o
+        Polars paralelize os grupos internamente no thread pool, sem N
+        reentradas em Python. As janelas (rolling, ewm) e os cum_sum do VWAP
+        reiniciam a cada símbolo.
+
+        Aceita os mesmos parâmetros de períodos de add_all_indicators.
+    '''
+
+    ema_exprs = {
+        period: ema_expr(period).over("symbol")
+        for period in sorted(set(ema_periods) | {macd_short, macd_long})
+    }
+
+    base_exprs = [sma_expr(period).over("symbol") for period in sma_periods]
+    base_exprs += list(ema_exprs.values())
+    base_exprs.append(rsi_wilder_expr(rsi_period).over("symbol"))
+    base_exprs += [expr.over("symbol") for expr in bollinger_exprs(bb_period, bb_std)]
+    base_exprs.append(atr_expr(atr_period).over("symbol"))
+    base_exprs.append(vwap_expr().over("symbol"))
+
+    lf = df.lazy() if isinstance(df, pl.DataFrame) else df
+
+    if precision == "f32":
+        lf = lf.with_columns(
+            pl.col(col).cast(pl.Float32) for col in ("open", "high", "low", "close", "volume")
+        )
+
+    lf = lf.with_columns(base_exprs)
+
+    lf = lf.with_columns(
+        expr.over("symbol") for expr in macd_exprs(macd_short, macd_long, macd_signal)
+    )
+
+    # Histograma é elemento a elemento, não precisa de janela por símbolo
+    lf = lf.with_columns(
+        (pl.col(f"macd_{macd_short}_{macd_long}") - pl.col(f"macd_signal_{macd_signal}")).alias("macd_histogram")
+    )
+
+    return lf.collect(engine="streaming")
@@ -1,4 +1,5 @@
 import polars as pl
+import numpy as np
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 from typing import Optional, List, Dict
@@ -10,6 +11,10 @@ logger = get_logger(__name__)
 
 
 class FinancialChart:
+    # Acima deste número de barras, traces de linha usam WebGL (Scattergl)
+    # em vez de SVG, que degrada com um nó de DOM por ponto
+    WEBGL_THRESHOLD = 2000
+
     def __init__(self, df: pl.DataFrame, config: Dict = None):
         '''
         Inicializa o gerador de gráficos financeiros
@@ -21,9 +26,17 @@ class FinancialChart:
         '''
         self.df = df
         self.config = config or {}
-        self.symbol = df['symbol'][0] if 'symbol' in df.columns else 'UNKNOWN'
+        self._cols = frozenset(df.columns)
+        self.symbol = df.get_column('symbol').item(0) if 'symbol' in self._cols else 'UNKNOWN'
         self.theme = self.config.get('theme', 'light')
         self.validate_data()
+        self._arrays = {
+            col: self.df[col].to_numpy()
+            for col in ('open', 'high', 'low', 'close', 'volume')
+        }
+        # Datas convertidas para ISO com o strftime do lado Rust, muito mais
+        # rápido que a serialização por elemento de datetimes no Plotly
+        self._arrays['date'] = self.df['date'].dt.to_string('%Y-%m-%dT%H:%M:%S').to_numpy()
         self._setup_theme_colors()
         
     def set_theme(self, theme: str):
@@ -33,12 +46,45 @@ class FinancialChart:
         self.theme = theme
         self._setup_theme_colors()
 
+        # Cores de volume dependem do tema; recomputar na próxima renderização
+        if '_vol_color' in self.df.columns:
+            self.df = self.df.drop('_vol_color')
+        self._arrays.pop('_vol_color', None)
+
+    def _ensure_colors_column(self):
+        '''
+        Garante a coluna de cores de volume, computada uma única vez por tema
+        '''
+        if '_vol_color' not in self.df.columns:
+            self.df = self.df.with_columns(
+                pl.when(pl.col('close') < pl.col('open'))
+                .then(pl.lit(self.colors['volume_decrease']))
+                .otherwise(pl.lit(self.colors['volume_increase']))
+                .alias('_vol_color')
+            )
+
+    def _scatter_cls(self):
+        '''
+        Seleciona go.Scattergl (WebGL) para séries grandes, go.Scatter caso contrário
+        '''
+        if len(self._arr('date')) > self.WEBGL_THRESHOLD:
+            return go.Scattergl
+        return go.Scatter
+
+    def _arr(self, col: str) -> np.ndarray:
+        '''
+        Retorna a coluna como ndarray, extraída uma única vez e cacheada
+        '''
+        if col not in self._arrays:
+            self._arrays[col] = self.df[col].to_numpy()
+        return self._arrays[col]
+
     def validate_data(self):
         '''
         Valida colunas necessárias
         '''
         required = ['date', 'open', 'high', 'low', 'close', 'volume']
-        missing = [col for col in required if col not in self.df.columns]
+        missing = [col for col in required if col not in self._cols]
 
         if missing:
             raise ValueError(f'Colunas obrigatórias faltando: {missing}')
@@ -159,14 +205,15 @@ class FinancialChart:
         '''
         Adiciona preço e indicadores de tendência.
         '''
-        dates = self.df['date'].to_list()
-        opens = self.df['open'].to_list()
-        highs = self.df['high'].to_list()
-        lows = self.df['low'].to_list()
-        closes = self.df['close'].to_list()
+        scatter = self._scatter_cls()
+        dates = self._arr('date')
+        opens = self._arr('open')
+        highs = self._arr('high')
+        lows = self._arr('low')
+        closes = self._arr('close')
 
         # Candlestick com cores temáticas
-        figure.add_trace(
+        traces = [
             go.Candlestick(
                 x=dates,
                 open=opens,
@@ -177,127 +224,109 @@ class FinancialChart:
                 showlegend=False,
                 increasing_line_color=self.colors['candle_increase'],
                 decreasing_line_color=self.colors['candle_decrease']
-            ),
-            row=row, col=1
-        )
+            )
+        ]
 
-        if 'sma_20' in self.df.columns:
-            figure.add_trace(
-                go.Scatter(
+        if 'sma_20' in self._cols:
+            traces.append(
+                scatter(
                     x=dates,
-                    y=self.df['sma_20'].to_list(),
+                    y=self._arr('sma_20'),
                     line=dict(color=self.colors['sma_20'], width=1.5),
                     name='SMA 20'
-                ),
-                row=row, col=1
+                )
             )
 
-        if 'sma_50' in self.df.columns:
-            figure.add_trace(
-                go.Scatter(
+        if 'sma_50' in self._cols:
+            traces.append(
+                scatter(
                     x=dates,
-                    y=self.df['sma_50'].to_list(),
+                    y=self._arr('sma_50'),
                     line=dict(color=self.colors['sma_50'], width=1.5),
                     name='SMA 50'
-                ),
-                row=row, col=1
+                )
             )
 
-        if 'ema_12' in self.df.columns:
-            figure.add_trace(
-                go.Scatter(
+        if 'ema_12' in self._cols:
+            traces.append(
+                scatter(
                     x=dates,
-                    y=self.df['ema_12'].to_list(),
+                    y=self._arr('ema_12'),
                     line=dict(color=self.colors['ema_12'], width=1.5),
                     name='EMA 12'
-                ),
-                row=row, col=1
+                )
             )
-        
-        if 'ema_26' in self.df.columns:
-            figure.add_trace(
-                go.Scatter(
+
+        if 'ema_26' in self._cols:
+            traces.append(
+                scatter(
                     x=dates,
-                    y=self.df['ema_26'].to_list(),
+                    y=self._arr('ema_26'),
                     line=dict(color=self.colors['ema_26'], width=1.5),
                     name='EMA 26'
-                ),
-                row=row, col=1
+                )
             )
 
-        if all(col in self.df.columns for col in ['bb_upper_20', 'bb_middle_20', 'bb_lower_20']):
-            bb_upper = self.df['bb_upper_20'].to_list()
-            bb_middle = self.df['bb_middle_20'].to_list()
-            bb_lower = self.df['bb_lower_20'].to_list()
-
-            figure.add_trace(
-                go.Scatter(
+        if all(col in self._cols for col in ['bb_upper_20', 'bb_middle_20', 'bb_lower_20']):
+            traces.append(
+                scatter(
                     x=dates,
-                    y=bb_upper,
+                    y=self._arr('bb_upper_20'),
                     line=dict(color=self.colors['bollinger'], width=1, dash='dash'),
                     name='BB Upper',
                     showlegend=False
-                ),
-                row=row, col=1
+                )
             )
 
-            figure.add_trace(
-                go.Scatter(
+            # Preenchimento via fill='tonexty' contra a banda superior,
+            # evitando o polígono 2N de dates + dates[::-1]
+            traces.append(
+                scatter(
                     x=dates,
-                    y=bb_middle,
-                    line=dict(color=self.colors['bollinger'], width=1),
-                    name='BB Middle',
-                    showlegend=False
-                ),
-                row=row, col=1
-            )
-
-            figure.add_trace(
-                go.Scatter(
-                    x=dates,
-                    y=bb_lower,
+                    y=self._arr('bb_lower_20'),
+                    fill='tonexty',
+                    fillcolor=self.colors['bollinger_fill'],
                     line=dict(color=self.colors['bollinger'], width=1, dash='dash'),
-                    name='BB Lower',
+                    name='Bollinger Bands',
                     showlegend=True,
                     legendgroup='bollinger'
-                ),
-                row=row, col=1
+                )
             )
 
-            figure.add_trace(
-                go.Scatter(
-                    x=dates + dates[::-1],
-                    y=bb_upper + bb_lower[::-1],
-                    fill='toself',
-                    fillcolor=self.colors['bollinger_fill'],
-                    line=dict(color='rgba(255,255,255,0)'),
-                    name='Bollinger Bands',
-                    showlegend=True
-                ),
-                row=row, col=1
+            traces.append(
+                scatter(
+                    x=dates,
+                    y=self._arr('bb_middle_20'),
+                    line=dict(color=self.colors['bollinger'], width=1),
+                    name='BB Middle',
+                    showlegend=False
+                )
             )
 
-        if 'vwap' in self.df.columns:
-            figure.add_trace(
-                go.Scatter(
+        if 'vwap' in self._cols:
+            traces.append(
+                scatter(
                     x=dates,
-                    y=self.df['vwap'].to_list(),
+                    y=self._arr('vwap'),
                     line=dict(color=self.colors['vwap'], width=2),
                     name='VWAP'
-                ),
-                row=row, col=1
+                )
             )
 
+        # Uma única chamada amortiza a validação do Plotly sobre todos os traces
+        figure.add_traces(traces, rows=[row] * len(traces), cols=[1] * len(traces))
+
     def _add_rsi(self, figure: go.Figure, row: int):
         '''
         Adiciona indicador RSI
         '''
-        if 'rsi_14' in self.df.columns:
-            dates = self.df['date'].to_list()
-            rsi_values = self.df['rsi_14'].to_list()
+        if 'rsi_14' in self._cols:
+            scatter = self._scatter_cls()
+            dates = self._arr('date')
+            rsi_values = self._arr('rsi_14')
 
             figure.add_trace(
-                go.Scatter(
+                scatter(
                     x=dates,
                     y=rsi_values,
                     line=dict(color=self.colors['rsi'], width=1.5),
@@ -306,6 +335,16 @@ class FinancialChart:
                 row=row, col=1
             )
 
+            # Faixa 30-70 como um único shape O(1), sem traces de N pontos
+            figure.add_hrect(
+                y0=30,
+                y1=70,
+                fillcolor=self.colors['rsi_fill'],
+                line_width=0,
+                row=row,
+                col=1
+            )
+
             figure.add_hline(
                 y=70,
                 line_dash='dash',
@@ -321,78 +360,51 @@ class FinancialChart:
                 col=1
             )
 
-            figure.add_trace(
-                go.Scatter(
-                    x=dates,
-                    y=[70] * len(dates),
-                    fill=None,
-                    line=dict(color='rgba(255,255,255,0)'),
-                    showlegend=False
-                ),
-                row=row, col=1
-            )
-
-            figure.add_trace(
-                go.Scatter(
-                    x=dates,
-                    y=[30] * len(dates),
-                    fill='tonexty',
-                    fillcolor=self.colors['rsi_fill'],
-                    line=dict(color='rgba(255,255,255,0)'),
-                    name='Zona de Sobrecompra',
-                    showlegend=True
-                ),
-                row=row, col=1
-            )
-
     def _add_macd(self, figure: go.Figure, row: int):
         '''
         Adiciona indicador MACD
         '''
-        if all(col in self.df.columns for col in ['macd_12_26', 'macd_signal_9']):
-            dates = self.df['date'].to_list()
-            macd_line = self.df['macd_12_26'].to_list()
-            macd_signal = self.df['macd_signal_9'].to_list()
-
-            figure.add_trace(
-                go.Scatter(
+        if all(col in self._cols for col in ['macd_12_26', 'macd_signal_9']):
+            scatter = self._scatter_cls()
+            dates = self._arr('date')
+            macd_line = self._arr('macd_12_26')
+            macd_signal = self._arr('macd_signal_9')
+
+            traces = [
+                scatter(
                     x=dates,
                     y=macd_line,
                     line=dict(color=self.colors['macd_line'], width=1.5),
                     name='MACD'
                 ),
-                row=row, col=1
-            )
-
-            figure.add_trace(
-                go.Scatter(
+                scatter(
                     x=dates,
                     y=macd_signal,
                     line=dict(color=self.colors['macd_signal'], width=1.5),
                     name='MACD Signal'
-                ),
-                row=row, col=1
-            )
+                )
+            ]
 
-            if 'macd_histogram' in self.df.columns:
-                macd_histogram = self.df['macd_histogram'].to_list()
-                colors = [
-                    self.colors['macd_positive'] if x >= 0 
-                    else self.colors['macd_negative'] 
-                    for x in macd_histogram
-                ]
+            if 'macd_histogram' in self._cols:
+                macd_histogram = self._arr('macd_histogram')
+                colors = np.where(
+                    macd_histogram >= 0,
+                    self.colors['macd_positive'],
+                    self.colors['macd_negative']
+                )
 
-                figure.add_trace(
+                traces.append(
                     go.Bar(
                         x=dates,
                         y=macd_histogram,
                         marker_color=colors,
                         name='MACD Hist',
                         opacity=0.6
-                    ),
-                    row=row, col=1
+                    )
                 )
-            
+
+            figure.add_traces(traces, rows=[row] * len(traces), cols=[1] * len(traces))
+
             figure.add_hline(
                 y=0,
                 line_color=self.colors['text'],
@@ -405,17 +417,12 @@ class FinancialChart:
         '''
         Adiciona volume
         '''
-        if 'volume' in self.df.columns:
-            dates = self.df['date'].to_list()
-            volumes = self.df['volume'].to_list()
-            opens = self.df['open'].to_list()
-            closes = self.df['close'].to_list()
-
-            colors = [
-                self.colors['volume_decrease'] if close < open 
-                else self.colors['volume_increase'] 
-                for open, close in zip(opens, closes)
-            ]
+        if 'volume' in self._cols:
+            dates = self._arr('date')
+            volumes = self._arr('volume')
+
+            self._ensure_colors_column()
+            colors = self._arr('_vol_color')
 
             figure.add_trace(
                 go.Bar(
@@ -432,12 +439,12 @@ class FinancialChart:
         '''
         Cria gráfico simplificado apenas com elementos simples (OHLCV)
         '''
-        dates = self.df['date'].to_list()
-        opens = self.df['open'].to_list()
-        highs = self.df['high'].to_list()
-        lows = self.df['low'].to_list()
-        closes = self.df['close'].to_list()
-        volumes = self.df['volume'].to_list()
+        dates = self._arr('date')
+        opens = self._arr('open')
+        highs = self._arr('high')
+        lows = self._arr('low')
+        closes = self._arr('close')
+        volumes = self._arr('volume')
 
         figure = make_subplots(
             rows=2, cols=1,
@@ -446,34 +453,29 @@ class FinancialChart:
             row_heights=[0.7, 0.3]
         )
 
-        figure.add_trace(
-            go.Candlestick(
-                x=dates,
-                open=opens,
-                high=highs,
-                low=lows,
-                close=closes,
-                name='Price',
-                increasing_line_color=self.colors['candle_increase'],
-                decreasing_line_color=self.colors['candle_decrease']
-            ),
-            row=1, col=1
-        )
-
-        volume_colors = [
-            self.colors['volume_decrease'] if close < open 
-            else self.colors['volume_increase'] 
-            for open, close in zip(opens, closes)
-        ]
+        self._ensure_colors_column()
+        volume_colors = self._arr('_vol_color')
 
-        figure.add_trace(
-            go.Bar(
-                x=dates,
-                y=volumes,
-                marker_color=volume_colors,
-                name='Volume'
-            ),
-            row=2, col=1
+        figure.add_traces(
+            [
+                go.Candlestick(
+                    x=dates,
+                    open=opens,
+                    high=highs,
+                    low=lows,
+                    close=closes,
+                    name='Price',
+                    increasing_line_color=self.colors['candle_increase'],
+                    decreasing_line_color=self.colors['candle_decrease']
+                ),
+                go.Bar(
+                    x=dates,
+                    y=volumes,
+                    marker_color=volume_colors,
+                    name='Volume'
+                )
+            ],
+            rows=[1, 2], cols=[1, 1]
         )
 
         figure.update_layout(